@@ -1,41 +1,80 @@
 #!/usr/bin/env python3
 """
-Growth News → Discord Webhook (Daily random 3)
+Growth News → Discord Webhook (Daily top 3)
 
 Posts valuable growth-hacking news to a Discord webhook.
 - Pulls multiple public RSS/Atom feeds (US-based growth leaders; excludes Sean Ellis).
-- Randomly selects DAILY_COUNT items within POST_WINDOW_HOURS.
+- Selects the DAILY_COUNT best-scoring items within POST_WINDOW_HOURS.
 - Supports optional Korean translation (same envs as agile bot).
 
 Env (common):
-- DISCORD_WEBHOOK_URL (required)
+- DISCORD_WEBHOOK_URL (required unless config/growth_news_destinations.yml lists destinations),
+  DISCORD_THREAD_ID (optional), DISCORD_MIN_INTERVAL (default 1.2s per destination)
+- OUTBOX_PATH (default .cache/growth_news_outbox.json), OUTBOX_MAX_ATTEMPTS (default 8),
+  OUTBOX_BACKOFF_SECONDS (default 300), OUTBOX_BACKOFF_MAX_SECONDS (default 21600),
+  OUTBOX_MAX_AGE_SECONDS (default 604800) — failed-post retries
 - POST_WINDOW_HOURS (default 72)
 - DAILY_COUNT (default 3), MAX_PER_SOURCE (default 1), PER_FEED_LIMIT (default 5)
 - TRANSLATE_TO, TRANSLATE_BACKEND, DEEPL_API_KEY, LIBRETRANSLATE_URL, LIBRETRANSLATE_API_KEY,
   OPENAI_API_KEY, OPENAI_MODEL
 - NITTER_BASE (optional) for X/Twitter via Nitter
+- SCORE_KEYWORDS ("term:weight,term"), SCORE_W_RECENCY, SCORE_W_SOURCE, SCORE_W_KEYWORD,
+  RECENCY_HALF_LIFE_HOURS (default 24), SCORE_JITTER (default 0), UNDATED_RECENCY (default 0) — selection scoring
+- SUMMARY_MAX_CHARS (default 600) — cleaned summary length sent for translation
+- TRANSLATE_WORKERS (default 8), TRANSLATE_CONCURRENCY_<BACKEND>, TRANSLATE_RPS_<BACKEND> (DEEPL|LIBRE|OPENAI)
+- FETCH_WORKERS (default 8), HOST_CONCURRENCY (default 1), HOST_MIN_INTERVAL (default 1.0s),
+  FETCH_RETRIES (default 2) — parallel fetching with per-host politeness
+- FEED_CACHE_DIR (default .cache/feeds), FEED_CACHE_TTL (default 900s), FEED_CACHE_MAX_BYTES (default 20 MB),
+  FEED_PARSE_MEMO (default 32 parsed feeds kept in memory)
+- CONFIG_CACHE_DIR (default .cache/config), STARTUP_BUDGET_MS (default 250)
+- HISTORY_DB (default .cache/growth_news_history.sqlite) — full-text index of posted items
 
-Optional config file overrides defaults: config/growth_news_sources.yml
+Usage: growth_news_bot.py [--flush-outbox]  (only retry queued posts)
+       growth_news_bot.py --search QUERY [--limit N]  (search posted history)
+
+Optional config file overrides defaults: config/growth_news_sources.yml ({ name, url, weight? })
+Optional fan-out targets: config/growth_news_destinations.yml ({ name, webhook_env, thread_id? })
 
 Dependencies: feedparser, pyyaml(optional)
 """
 from __future__ import annotations
 
-import os, sys, json, time, random
-import urllib.request, urllib.parse, urllib.error
+import os, sys, json, time, calendar, random, math, re, heapq, html, gzip, hashlib
+import argparse, threading, collections
+import urllib.parse
 import subprocess
-from typing import List, Tuple, Optional, Set, Dict, Any
+from typing import TYPE_CHECKING, List, Tuple, Optional, Set, Dict, Any, Callable, Iterator
+if TYPE_CHECKING:
+    from http.client import HTTPConnection as _HTTPConnection
+else:
+    _HTTPConnection = Any
+
+_STARTED_AT = time.perf_counter()  # STARTUP_BUDGET_MS clock; heavy modules are imported lazily
+_feedparser_mod: Any = None
+_yaml_mod: Any = False  # False = not tried yet, None = unavailable
+
+
+def _feedparser() -> Any:
+    global _feedparser_mod
+    if _feedparser_mod is None:
+        try:
+            import feedparser  # type: ignore
+        except Exception:
+            print("Missing dependency: feedparser. Install with `pip install feedparser`.", file=sys.stderr)
+            sys.exit(2)
+        _feedparser_mod = feedparser
+    return _feedparser_mod
 
-try:
-    import feedparser  # type: ignore
-except Exception:
-    print("Missing dependency: feedparser. Install with `pip install feedparser`.", file=sys.stderr)
-    sys.exit(2)
 
-try:
-    import yaml  # type: ignore
-except Exception:
-    yaml = None
+def _yaml() -> Any:
+    global _yaml_mod
+    if _yaml_mod is False:
+        try:
+            import yaml  # type: ignore
+        except Exception:
+            yaml = None
+        _yaml_mod = yaml
+    return _yaml_mod
 
 
 def get_env(name: str) -> str:
@@ -62,52 +101,462 @@ def default_sources() -> List[Tuple[str, str]]:
     return sources
 
 
-def load_sources_from_yaml(path: str) -> Optional[List[Tuple[str, str]]]:
-    if yaml is None or not os.path.exists(path):
+_CONFIG_MEMO: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+
+
+def _read_yaml_list(path: str) -> Optional[List[Dict[str, Any]]]:
+    if path not in _CONFIG_MEMO:
+        _CONFIG_MEMO[path] = _load_yaml_list(path)
+    return _CONFIG_MEMO[path]
+
+
+def _load_yaml_list(path: str) -> Optional[List[Dict[str, Any]]]:
+    try:
+        st = os.stat(path)
+    except OSError:
         return None
+    stamp = [st.st_mtime_ns, st.st_size]
+    cache_dir = os.environ.get("CONFIG_CACHE_DIR", ".cache/config")
+    cache_path = os.path.join(cache_dir, os.path.basename(path) + ".json")
+    cached: Dict[str, Any] = {}
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or []
-        out: List[Tuple[str, str]] = []
-        for item in data:
-            name = str(item.get("name", "")).strip()
-            url = str(item.get("url", "")).strip()
-            if name and url:
-                out.append((name, url))
-        return out or None
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("stamp") == stamp:
+            return cached.get("data")
+    except Exception:
+        cached = {}
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except OSError:
+        return None
+    digest = hashlib.sha256(raw).hexdigest()
+    if cached.get("sha256") == digest:
+        data = cached.get("data")
+    else:
+        yaml = _yaml()
+        if yaml is None:
+            return None
+        try:
+            data = [item for item in (yaml.safe_load(raw) or []) if isinstance(item, dict)]
+        except Exception as e:
+            print(f"[WARN] YAML sources error: {e}", file=sys.stderr)
+            return None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump({"stamp": stamp, "sha256": digest, "data": data}, f, ensure_ascii=False)
     except Exception as e:
-        print(f"[WARN] YAML sources error: {e}", file=sys.stderr)
+        print(f"[WARN] Failed to write config cache: {e}", file=sys.stderr)
+    return data
+
+
+def load_sources_from_yaml(path: str) -> Optional[List[Tuple[str, str]]]:
+    out: List[Tuple[str, str]] = []
+    for item in _read_yaml_list(path) or []:
+        name = str(item.get("name", "")).strip()
+        url = str(item.get("url", "")).strip()
+        if name and url:
+            out.append((name, url))
+    return out or None
+
+
+def load_source_weights(path: str) -> Dict[str, float]:
+    weights: Dict[str, float] = {}
+    for item in _read_yaml_list(path) or []:
+        name = str(item.get("name", "")).strip()
+        if not name or "weight" not in item:
+            continue
+        try:
+            weights[name] = float(item["weight"])
+        except (TypeError, ValueError):
+            print(f"[WARN] Invalid weight for source {name!r}", file=sys.stderr)
+    return weights
+
+
+# Fetching: per-host concurrency + min interval, keep-alive reuse, Retry-After
+
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+_RETRY_CODES = (429, 503)
+
+
+class _Pacer:
+    def __init__(self, min_interval: float) -> None:
+        self.min_interval = min_interval
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+    def defer(self, seconds: float) -> None:
+        with self._lock:
+            self._next_at = max(self._next_at, time.monotonic() + seconds)
+
+
+def _retry_after_seconds(value: Optional[str], default: float, cap: float) -> float:
+    if not value:
+        return default
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        import email.utils
+
+        try:
+            seconds = email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+        except Exception:
+            return default
+    return min(max(seconds, 0.0), cap)
+
+
+class HostScheduler:
+
+    def __init__(self, concurrency: int = 1, min_interval: float = 1.0, retries: int = 2, max_retry_after: float = 60.0) -> None:
+        self.concurrency = max(concurrency, 1)
+        self.min_interval = max(min_interval, 0.0)
+        self.retries = max(retries, 0)
+        self.max_retry_after = max_retry_after
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Tuple[threading.Semaphore, _Pacer]] = {}
+        self._idle: Dict[str, List[_HTTPConnection]] = {}
+
+    @classmethod
+    def from_env(cls) -> "HostScheduler":
+        return cls(
+            concurrency=int(os.environ.get("HOST_CONCURRENCY", "1")),
+            min_interval=float(os.environ.get("HOST_MIN_INTERVAL", "1.0")),
+            retries=int(os.environ.get("FETCH_RETRIES", "2")),
+        )
+
+    def _host(self, key: str) -> Tuple[threading.Semaphore, _Pacer]:
+        with self._lock:
+            slot = self._hosts.get(key)
+            if slot is None:
+                slot = (threading.BoundedSemaphore(self.concurrency), _Pacer(self.min_interval))
+                self._hosts[key] = slot
+            return slot
+
+    @staticmethod
+    def _connect(parts: urllib.parse.SplitResult, timeout: float) -> _HTTPConnection:
+        import http.client
+
+        if parts.scheme == "https":
+            return http.client.HTTPSConnection(parts.netloc, timeout=timeout)
+        return http.client.HTTPConnection(parts.netloc, timeout=timeout)
+
+    def _checkout(self, parts: urllib.parse.SplitResult, timeout: float) -> Tuple[_HTTPConnection, bool]:
+        with self._lock:
+            pool = self._idle.get(f"{parts.scheme}://{parts.netloc}")
+            if pool:
+                return pool.pop(), True
+        return self._connect(parts, timeout), False
+
+    def _checkin(self, parts: urllib.parse.SplitResult, conn: _HTTPConnection) -> None:
+        with self._lock:
+            self._idle.setdefault(f"{parts.scheme}://{parts.netloc}", []).append(conn)
+
+    def _request(self, parts: urllib.parse.SplitResult, headers: Dict[str, str], timeout: float) -> Tuple[int, Any, bytes]:
+        import http.client
+
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        conn, reused = self._checkout(parts, timeout)
+        while True:
+            try:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+                break
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                if not reused:
+                    raise
+                conn, reused = self._connect(parts, timeout), False
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin(parts, conn)
+        if (resp.getheader("Content-Encoding") or "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return resp.status, resp, body
+
+    def get(self, url: str, headers: Dict[str, str], timeout: float = 15.0, max_redirects: int = 5) -> Tuple[bytes, str]:
+        headers = dict(headers, **{"Accept-Encoding": "gzip", "Connection": "keep-alive"})
+        for _ in range(max_redirects + 1):
+            parts = urllib.parse.urlsplit(url)
+            if parts.scheme not in ("http", "https"):
+                raise ValueError(f"Unsupported URL scheme: {url}")
+            sem, pacer = self._host(parts.netloc.lower())
+            with sem:
+                for attempt in range(self.retries + 1):
+                    pacer.wait()
+                    status, resp, body = self._request(parts, headers, timeout)
+                    if status in _RETRY_CODES and attempt < self.retries:
+                        delay = _retry_after_seconds(resp.getheader("Retry-After"), 2.0 ** (attempt + 1), self.max_retry_after)
+                        print(f"[WARN] {parts.netloc} HTTP {status}; retrying in {delay:.1f}s", file=sys.stderr)
+                        pacer.defer(delay)
+                        continue
+                    break
+            location = resp.getheader("Location")
+            if status in _REDIRECT_CODES and location:
+                url = urllib.parse.urljoin(url, location)
+                continue
+            if status >= 400:
+                raise RuntimeError(f"HTTP {status} for {url}")
+            # feedparser needs the header charset for bodies that don't declare one
+            return body, resp.getheader("Content-Type") or ""
+        raise RuntimeError(f"Too many redirects for {url}")
+
+
+_scheduler: Optional[HostScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> HostScheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = HostScheduler.from_env()
+        return _scheduler
+
+
+class FeedCache:
+    """Raw feed bodies keyed by URL → SHA-256 (zstd or gzip on disk); parsed results memoised per hash."""
+
+    def __init__(self, directory: str, ttl: float = 900.0, max_bytes: int = 20_000_000, parse_memo: int = 32) -> None:
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.parse_memo = max(parse_memo, 0)
+        self._lock = threading.Lock()
+        # LRU of parsed feeds by body hash, bounded so long source lists don't pin every feed
+        self._parsed: collections.OrderedDict[str, Any] = collections.OrderedDict()
+        self._index: Dict[str, Dict[str, Any]] = {}
+        # put() only touches memory; flush() evicts and writes index.json once per run
+        self._dirty = False
+        self._replaced: Set[str] = set()
+        try:
+            with open(os.path.join(directory, "index.json"), "r", encoding="utf-8") as f:
+                self._index = json.load(f)
+        except Exception:
+            self._index = {}
+
+    @classmethod
+    def from_env(cls) -> "FeedCache":
+        return cls(
+            os.environ.get("FEED_CACHE_DIR", ".cache/feeds"),
+            ttl=float(os.environ.get("FEED_CACHE_TTL", "900")),
+            max_bytes=int(os.environ.get("FEED_CACHE_MAX_BYTES", "20000000")),
+            parse_memo=int(os.environ.get("FEED_PARSE_MEMO", "32")),
+        )
+
+    @staticmethod
+    def _codec() -> Tuple[str, Callable[[bytes], bytes]]:
+        try:
+            import zstandard  # type: ignore
+
+            return ".zst", zstandard.ZstdCompressor(level=10).compress
+        except Exception:
+            return ".gz", lambda data: gzip.compress(data, compresslevel=6)
+
+    def _blob_path(self, digest: str) -> Optional[str]:
+        for ext in (".zst", ".gz"):
+            path = os.path.join(self.directory, digest + ext)
+            if os.path.exists(path):
+                return path
         return None
 
+    def _read_blob(self, digest: str) -> Optional[bytes]:
+        path = self._blob_path(digest)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            if path.endswith(".zst"):
+                import zstandard  # type: ignore
+
+                return zstandard.ZstdDecompressor().decompress(data)
+            return gzip.decompress(data)
+        except Exception:
+            return None
+
+    def fresh_digest(self, url: str) -> Optional[Tuple[str, str]]:
+        with self._lock:
+            meta = self._index.get(url)
+        if not meta or time.time() - meta.get("fetched_at", 0.0) > self.ttl:
+            return None
+        digest = meta.get("sha256")
+        if digest in self._parsed or self._blob_path(digest):
+            return digest, meta.get("content_type", "")
+        return None
+
+    def put(self, url: str, body: bytes, content_type: str = "") -> str:
+        digest = hashlib.sha256(body).hexdigest()
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._blob_path(digest)
+            if path is None:
+                ext, compress = self._codec()
+                data = compress(body)
+                tmp = os.path.join(self.directory, f"{digest}{ext}.{threading.get_ident()}.tmp")
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, os.path.join(self.directory, digest + ext))
+                size = len(data)
+            else:
+                size = os.path.getsize(path)
+            with self._lock:
+                previous = self._index.get(url, {}).get("sha256")
+                if previous and previous != digest:
+                    self._replaced.add(previous)
+                self._index[url] = {"sha256": digest, "fetched_at": time.time(), "size": size, "content_type": content_type}
+                self._dirty = True
+        except Exception as e:
+            print(f"[WARN] Feed cache write failed: {e}", file=sys.stderr)
+        return digest
+
+    def parse(self, digest: str, body: Optional[bytes] = None, content_type: str = "") -> Any:
+        with self._lock:
+            parsed = self._parsed.get(digest)
+            if parsed is not None:
+                self._parsed.move_to_end(digest)
+        if parsed is not None:
+            return parsed
+        if body is None:
+            body = self._read_blob(digest)
+            if body is None:
+                return None
+        parsed = _feedparser().parse(body, response_headers={"content-type": content_type} if content_type else None)
+        with self._lock:
+            self._parsed[digest] = parsed
+            while len(self._parsed) > self.parse_memo:
+                self._parsed.popitem(last=False)
+        return parsed
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self._evict()
+                self._save_index()
+                self._dirty = False
+            except Exception as e:
+                print(f"[WARN] Feed cache flush failed: {e}", file=sys.stderr)
+
+    def _evict(self) -> None:
+        # Drop blobs (least recently fetched first) until under max_bytes; caller holds the lock.
+        # Sizes come from the index, so this never lists or stats the whole directory.
+        sizes: Dict[str, int] = {}
+        last_used: Dict[str, float] = {}
+        for meta in self._index.values():
+            digest = meta.get("sha256", "")
+            if "size" not in meta:
+                # Index written before sizes were recorded: stat once and remember
+                path = self._blob_path(digest)
+                meta["size"] = os.path.getsize(path) if path else 0
+            sizes[digest] = meta["size"]
+            last_used[digest] = max(last_used.get(digest, 0.0), meta.get("fetched_at", 0.0))
+        # Bodies no URL points at any more are dead weight
+        for digest in self._replaced - set(sizes):
+            path = self._blob_path(digest)
+            if path:
+                os.remove(path)
+        self._replaced.clear()
+        total = sum(sizes.values())
+        evicted: Set[str] = set()
+        for digest in sorted(sizes, key=lambda d: last_used[d]):
+            if total <= self.max_bytes:
+                break
+            path = self._blob_path(digest)
+            if path:
+                os.remove(path)
+            total -= sizes[digest]
+            evicted.add(digest)
+        if evicted:
+            self._index = {u: m for u, m in self._index.items() if m.get("sha256") not in evicted}
+
+    def _save_index(self) -> None:
+        tmp = os.path.join(self.directory, "index.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp, os.path.join(self.directory, "index.json"))
+
+
+_feed_cache: Optional[FeedCache] = None
+
+
+def get_feed_cache() -> FeedCache:
+    global _feed_cache
+    with _scheduler_lock:
+        if _feed_cache is None:
+            _feed_cache = FeedCache.from_env()
+        return _feed_cache
+
 
 def fetch_feed(url: str):
     headers = {
         "User-Agent": "NerdlabNewsBot/1.0 (+https://nerdlab.local)",
         "Accept": "application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8",
     }
+    cache = get_feed_cache()
     try:
-        feed = feedparser.parse(url, request_headers=headers)
-        if getattr(feed, 'entries', None):
-            return feed
-    except Exception:
-        pass
+        hit = cache.fresh_digest(url)
+        if hit is not None:
+            digest, content_type = hit
+            parsed = cache.parse(digest, content_type=content_type)
+            if parsed is not None:
+                return parsed
+        content, content_type = get_scheduler().get(url, headers)
+        return cache.parse(cache.put(url, content, content_type), content, content_type)
+    except Exception as e:
+        print(f"[WARN] Fetch {url}: {e}", file=sys.stderr)
+        return _feedparser().parse(b"")
+
+
+def fetch_all(sources: List[Tuple[str, str]]) -> Iterator[Tuple[str, Any]]:
+    workers = max(int(os.environ.get("FETCH_WORKERS", "8")), 1)
+    import concurrent.futures
+
+    def _completed(in_flight: Dict[Any, str]) -> Iterator[Tuple[str, Any]]:
+        done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+        for fut in done:
+            yield in_flight.pop(fut), fut.result()
+
     try:
-        req = urllib.request.Request(url, headers=headers, method="GET")
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            content = resp.read()
-        return feedparser.parse(content)
-    except Exception:
-        return feedparser.parse("")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            in_flight: Dict[Any, str] = {}
+            for source, url in sources:
+                in_flight[pool.submit(fetch_feed, url)] = source
+                if len(in_flight) >= workers * 2:
+                    yield from _completed(in_flight)
+            while in_flight:
+                yield from _completed(in_flight)
+    finally:
+        get_feed_cache().flush()
 
 
-def post_discord(webhook: str, content: str) -> None:
-    """Post message to Discord with urllib -> curl fallback.
+def post_discord(webhook: str, content: str, thread_id: Optional[str] = None) -> bool:
+    """Post message to Discord with urllib -> curl fallback; True on 2xx.
 
     Controlled by envs:
     - DISCORD_USE_CURL: if truthy, use curl directly
     - STRICT_DISCORD: if truthy, raise on non-2xx
+    - DISCORD_THREAD_ID: default for `thread_id`
+    HTTP 429 is retried once after Retry-After.
     """
-    thread_id = os.environ.get("DISCORD_THREAD_ID", "").strip()
+    if thread_id is None:
+        thread_id = os.environ.get("DISCORD_THREAD_ID", "")
+    thread_id = thread_id.strip()
     url = webhook
     url += ("&" if "?" in url else "?") + "wait=true"
     if thread_id:
@@ -117,7 +566,7 @@ def post_discord(webhook: str, content: str) -> None:
     strict = os.environ.get("STRICT_DISCORD", "").lower() not in ("", "0", "false", "no")
     force_curl = os.environ.get("DISCORD_USE_CURL", "").lower() not in ("", "0", "false", "no")
 
-    def _curl_send() -> None:
+    def _curl_send() -> Tuple[int, Optional[str]]:
         try:
             proc = subprocess.run(
                 [
@@ -139,82 +588,525 @@ def post_discord(webhook: str, content: str) -> None:
                 timeout=30,
             )
             status_code = 0
+            retry_after: Optional[str] = None
             for line in proc.stdout.splitlines():
-                if line.startswith("HTTP/"):
+                if not line.strip():
+                    break
+                if line.startswith("HTTP/") and not status_code:
                     parts = line.split()
                     if len(parts) >= 2 and parts[1].isdigit():
                         status_code = int(parts[1])
-                    break
+                elif line.lower().startswith("retry-after:"):
+                    retry_after = line.split(":", 1)[1].strip()
             if status_code and status_code < 300:
                 print(f"[INFO] curl Discord post OK: HTTP {status_code}")
-            else:
-                msg = f"[ERROR] curl Discord post failed: HTTP {status_code or 'unknown'}"
-                print(msg, file=sys.stderr)
-                if strict:
-                    raise RuntimeError(msg)
+            return status_code, retry_after
         except Exception as e:
             print(f"[ERROR] curl post error: {e}", file=sys.stderr)
-            if strict:
-                raise
+            return 0, None
 
-    if force_curl:
-        _curl_send()
-        return
+    def _urllib_send() -> Tuple[int, Optional[str]]:
+        import urllib.request
+        import urllib.error
 
-    # urllib path first
-    data = payload.encode("utf-8")
-    headers = {
-        "Content-Type": "application/json",
-        "User-Agent": "NerdlabNewsBot/1.0 (+https://nerdlab.local)",
-    }
-    req = urllib.request.Request(url, data=data, headers=headers, method="POST")
-    try:
-        with urllib.request.urlopen(req, timeout=20) as resp:
-            if resp.status >= 300:
-                body = resp.read().decode("utf-8", errors="ignore")
-                err = f"Discord responded with {resp.status}: {body}"
-                print(f"[ERROR] {err}", file=sys.stderr)
-                if strict:
-                    raise RuntimeError(err)
-    except urllib.error.HTTPError as e:
-        body = e.read().decode("utf-8", errors="ignore")
-        print(f"[WARN] urllib HTTPError {e.code}: {body}", file=sys.stderr)
-        _curl_send()
-    except urllib.error.URLError as e:
-        print(f"[WARN] urllib URLError: {e.reason}", file=sys.stderr)
-        _curl_send()
+        data = payload.encode("utf-8")
+        headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "NerdlabNewsBot/1.0 (+https://nerdlab.local)",
+        }
+        req = urllib.request.Request(url, data=data, headers=headers, method="POST")
+        try:
+            with urllib.request.urlopen(req, timeout=20) as resp:
+                return resp.status, None
+        except urllib.error.HTTPError as e:
+            if e.code == 429:
+                return 429, e.headers.get("Retry-After")
+            body = e.read().decode("utf-8", errors="ignore")
+            print(f"[WARN] urllib HTTPError {e.code}: {body}", file=sys.stderr)
+            return _curl_send()
+        except urllib.error.URLError as e:
+            print(f"[WARN] urllib URLError: {e.reason}", file=sys.stderr)
+            return _curl_send()
+
+    send = _curl_send if force_curl else _urllib_send
+    status_code, retry_after = send()
+    if status_code == 429:
+        delay = _retry_after_seconds(retry_after, 1.0, 30.0)
+        print(f"[WARN] Discord rate limited; retrying in {delay:.1f}s", file=sys.stderr)
+        time.sleep(delay)
+        status_code, _ = send()
+    if 200 <= status_code < 300:
+        return True
+    msg = f"[ERROR] Discord post failed: HTTP {status_code or 'unknown'}"
+    print(msg, file=sys.stderr)
+    if strict:
+        raise RuntimeError(msg)
+    return False
+
+
+class Destination:
+    def __init__(self, name: str, webhook: str, thread_id: str = "", min_interval: float = 1.2) -> None:
+        self.name = name
+        self.webhook = webhook
+        self.thread_id = thread_id
+        self.pacer = _Pacer(min_interval)
+
+
+def load_destinations(path: str) -> List[Destination]:
+    """YAML { name, webhook_env, thread_id? } list, else DISCORD_WEBHOOK_URL."""
+    min_interval = float(os.environ.get("DISCORD_MIN_INTERVAL", "1.2"))
+    result: List[Destination] = []
+    for item in _read_yaml_list(path) or []:
+        name = str(item.get("name", "")).strip()
+        env_name = str(item.get("webhook_env", "")).strip()
+        webhook = os.environ.get(env_name, "").strip() if env_name else ""
+        if not name or not webhook:
+            print(f"[WARN] Skipping destination {name or env_name!r}: webhook not set", file=sys.stderr)
+            continue
+        if any(d.name == name for d in result):
+            # Outbox ids, results and reports are keyed by name; a second entry would misdeliver
+            print(f"[WARN] Skipping destination {name!r}: duplicate name", file=sys.stderr)
+            continue
+        thread_id = str(item.get("thread_id", "") or "").strip()
+        result.append(Destination(name, webhook, thread_id, min_interval))
+    if result:
+        return result
+    webhook = get_env("DISCORD_WEBHOOK_URL")
+    return [Destination("default", webhook, os.environ.get("DISCORD_THREAD_ID", "").strip(), min_interval)]
+
+
+def deliver(destinations: List[Destination], content: str) -> Dict[str, bool]:
+    def _send(dest: Destination) -> bool:
+        dest.pacer.wait()
+        try:
+            return post_discord(dest.webhook, content, dest.thread_id)
+        except Exception as e:
+            print(f"[WARN] Discord post to {dest.name} failed: {e}", file=sys.stderr)
+            return False
+        finally:
+            # Space the next post from when this one (and any 429 retry) finished
+            dest.pacer.defer(dest.pacer.min_interval)
+
+    import concurrent.futures
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(len(destinations), 1)) as pool:
+        results = list(pool.map(_send, destinations))
+    return {dest.name: ok for dest, ok in zip(destinations, results)}
+
+
+class Outbox:
+    """Durable per-(message, destination) queue: enqueue → send → ack, else backoff retry on later runs."""
+
+    def __init__(
+        self,
+        path: str,
+        max_attempts: int = 8,
+        backoff: float = 300.0,
+        backoff_max: float = 21600.0,
+        max_age: float = 604800.0,
+        on_sent: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
+        self.path = path
+        self.on_sent = on_sent
+        self.max_attempts = max(max_attempts, 1)
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.max_age = max_age
+        self.items: List[Dict[str, Any]] = self._load()
+
+    @classmethod
+    def from_env(cls, default_path: str, on_sent: Optional[Callable[[Dict[str, Any]], None]] = None) -> "Outbox":
+        return cls(
+            os.environ.get("OUTBOX_PATH", default_path),
+            max_attempts=int(os.environ.get("OUTBOX_MAX_ATTEMPTS", "8")),
+            backoff=float(os.environ.get("OUTBOX_BACKOFF_SECONDS", "300")),
+            backoff_max=float(os.environ.get("OUTBOX_BACKOFF_MAX_SECONDS", "21600")),
+            max_age=float(os.environ.get("OUTBOX_MAX_AGE_SECONDS", "604800")),
+            on_sent=on_sent,
+        )
+
+    def _load(self) -> List[Dict[str, Any]]:
+        try:
+            if not os.path.exists(self.path):
+                return []
+            with open(self.path, "r", encoding="utf-8") as f:
+                data: Dict[str, Any] = json.load(f)
+            return [item for item in data.get("items", []) if isinstance(item, dict)]
+        except Exception as e:
+            print(f"[WARN] Failed to read outbox: {e}", file=sys.stderr)
+            return []
+
+    def save(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"items": self.items}, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            print(f"[WARN] Failed to save outbox: {e}", file=sys.stderr)
+
+    def enqueue(
+        self, content: str, link: str, destinations: List[Destination], meta: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        queued = {item["id"] for item in self.items}
+        added: List[Dict[str, Any]] = []
+        for dest in destinations:
+            item_id = hashlib.sha1(f"{dest.name}\n{link}".encode("utf-8")).hexdigest()[:16]
+            if item_id in queued:
+                continue
+            item = {
+                "id": item_id,
+                "dest": dest.name,
+                "link": link,
+                "content": content,
+                "meta": meta or {},
+                "attempts": 0,
+                "next_at": 0.0,
+                "created_at": time.time(),
+            }
+            self.items.append(item)
+            added.append(item)
+        self.save()
+        return added
+
+    def due(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        now = time.time() if now is None else now
+        return [item for item in self.items if item.get("next_at", 0.0) <= now]
+
+    def flush(self, destinations: List[Destination], items: Optional[List[Dict[str, Any]]] = None) -> Dict[str, int]:
+        by_name = {dest.name: dest for dest in destinations}
+        pending = self.due() if items is None else items
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        now = time.time()
+        expired = 0
+        for item in pending:
+            if item["dest"] not in by_name:
+                # Destination not configured on this run (e.g. its secret is unset): keep the
+                # item queued and only expire it once it is older than OUTBOX_MAX_AGE_SECONDS
+                if now - float(item.get("created_at", now)) > self.max_age:
+                    print(f"[ERROR] Outbox: expiring {item['link']} → {item['dest']} (destination unavailable)", file=sys.stderr)
+                    self.items.remove(item)
+                    expired += 1
+                else:
+                    print(f"[WARN] Outbox: destination {item['dest']!r} not configured; keeping item queued", file=sys.stderr)
+                continue
+            groups.setdefault(item["content"], []).append(item)
+        sent: Dict[str, int] = {name: 0 for name in by_name}
+        for content, group in groups.items():
+            results = deliver([by_name[item["dest"]] for item in group], content)
+            for item in group:
+                if results.get(item["dest"]):
+                    self.items.remove(item)
+                    sent[item["dest"]] += 1
+                    if self.on_sent:
+                        self.on_sent(item)
+                else:
+                    self._retry_later(item)
+            self.save()
+        if expired:
+            self.save()
+        return sent
+
+    def _retry_later(self, item: Dict[str, Any]) -> None:
+        item["attempts"] = int(item.get("attempts", 0)) + 1
+        if item["attempts"] >= self.max_attempts:
+            print(f"[ERROR] Outbox: giving up on {item['link']} → {item['dest']} after {item['attempts']} attempts", file=sys.stderr)
+            self.items.remove(item)
+            return
+        delay = min(self.backoff * 2 ** (item["attempts"] - 1), self.backoff_max)
+        item["next_at"] = time.time() + delay
+        print(f"[WARN] Outbox: {item['link']} → {item['dest']} queued for retry in {delay:.0f}s", file=sys.stderr)
+
+
+class HistoryIndex:
+    """SQLite index of posted items; FTS5 over title/summary/source/translation, LIKE fallback."""
+
+    def __init__(self, path: str) -> None:
+        import sqlite3
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS posts ("
+            "link TEXT PRIMARY KEY, title TEXT, summary TEXT, source TEXT, "
+            "published REAL, posted_at REAL, translation TEXT)"
+        )
+        try:
+            self.conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5("
+                "title, summary, source, translation, content='posts', content_rowid='rowid', "
+                "tokenize='unicode61 remove_diacritics 2')"
+            )
+            self.fts = True
+        except sqlite3.OperationalError:
+            self.fts = False
+        self.conn.commit()
+
+    def add(self, link: str, title: str, summary: str, source: str, published: Optional[float], translation: Optional[str]) -> None:
+        cur = self.conn.execute(
+            "INSERT OR IGNORE INTO posts (link, title, summary, source, published, posted_at, translation) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (link, title, summary, source, published, time.time(), translation or ""),
+        )
+        if cur.rowcount and self.fts:
+            self.conn.execute(
+                "INSERT INTO posts_fts (rowid, title, summary, source, translation) VALUES (?, ?, ?, ?, ?)",
+                (cur.lastrowid, title, summary, source, translation or ""),
+            )
+        self.conn.commit()
+
+    def add_item(self, item: Dict[str, Any]) -> None:
+        meta = item.get("meta") or {}
+        try:
+            self.add(
+                item["link"],
+                meta.get("title", ""),
+                meta.get("summary", ""),
+                meta.get("source", ""),
+                meta.get("published"),
+                meta.get("translation"),
+            )
+        except Exception as e:
+            print(f"[WARN] History index update failed: {e}", file=sys.stderr)
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[float, str, str, str]]:
+        terms = query.split()
+        if not terms:
+            return []
+        if self.fts:
+            # Quote each term so user input can't trip FTS5 query syntax
+            match = " ".join('"' + t.replace('"', '""') + '"' for t in terms)
+            sql = (
+                "SELECT p.posted_at, p.source, p.title, p.link FROM posts_fts "
+                "JOIN posts p ON p.rowid = posts_fts.rowid "
+                "WHERE posts_fts MATCH ? ORDER BY bm25(posts_fts) LIMIT ?"
+            )
+            return self.conn.execute(sql, (match, limit)).fetchall()
+        clauses = " AND ".join("(title || ' ' || summary || ' ' || source || ' ' || translation) LIKE ?" for _ in terms)
+        sql = f"SELECT posted_at, source, title, link FROM posts WHERE {clauses} ORDER BY posted_at DESC LIMIT ?"
+        return self.conn.execute(sql, [f"%{t}%" for t in terms] + [limit]).fetchall()
+
+
+def print_search_results(rows: List[Tuple[float, str, str, str]]) -> None:
+    if not rows:
+        print("No matches.")
+        return
+    for posted_at, source, title, link in rows:
+        day = time.strftime("%Y-%m-%d", time.gmtime(posted_at or 0))
+        print(f"{day}  [{source}] {title}\n    {link}")
 
 
 def _ensure_len(s: str, limit: int = 1900) -> str:
     return s if len(s) <= limit else s[: limit - 3] + "..."
 
 
-def build_message(source: str, entry, translate_to: Optional[str]) -> str:
+# Summary pre-processing: HTML → plain text, sentence-bounded truncation
+
+_BLOCK_RE = re.compile(r"<!--.*?-->|<(script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+# Block-level tags separate words; inline ones (<b>, <a>, <span>, ...) must not
+_BREAK_TAG_RE = re.compile(
+    r"</?(?:p|div|br|hr|li|ul|ol|dl|dt|dd|h[1-6]|table|tr|td|th|blockquote|pre|section|article|header|footer|figure|figcaption)\b[^>]*>",
+    re.IGNORECASE,
+)
+_TAG_RE = re.compile(r"</?[A-Za-z][^>]*>|<![^>]*>")
+_WS_RE = re.compile(r"\s+")
+_SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+([.,;:!?)\]])")
+_SENTENCE_END_RE = re.compile(r"[.!?。](?=\s|$)")
+
+
+def _strip_tags(raw: str) -> str:
+    return _TAG_RE.sub("", _BREAK_TAG_RE.sub(" ", _BLOCK_RE.sub(" ", raw)))
+
+
+def html_to_text(raw: str) -> str:
+    if "<" in raw:
+        raw = _strip_tags(raw)
+    if "&" in raw:
+        raw = html.unescape(raw)
+        # Entity-encoded markup (&lt;p&gt;) only becomes tags once decoded
+        if "<" in raw:
+            raw = _strip_tags(raw)
+    return _SPACE_BEFORE_PUNCT_RE.sub(r"\1", _WS_RE.sub(" ", raw)).strip()
+
+
+def truncate_sentences(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    head = text[:limit]
+    end = 0
+    for m in _SENTENCE_END_RE.finditer(head):
+        end = m.end()
+    if end >= limit // 2:
+        return head[:end]
+    space = head.rfind(" ", 0, limit - 3)
+    cut = head[:space] if space >= limit // 2 else head[: limit - 3]
+    return cut.rstrip() + "..."
+
+
+def clean_summary(entry, limit: Optional[int] = None) -> str:
+    if limit is None:
+        limit = int(os.environ.get("SUMMARY_MAX_CHARS", "600"))
+    # Cached on the entry itself so it lives exactly as long as the entry
+    cache = getattr(entry, "_clean_summary", None)
+    if cache is not None and limit in cache:
+        return cache[limit]
+    raw = getattr(entry, "summary", None) or getattr(entry, "description", None) or ""
+    text = truncate_sentences(html_to_text(str(raw)), limit)
+    try:
+        if cache is None:
+            cache = entry._clean_summary = {}
+        cache[limit] = text
+    except Exception:
+        pass
+    return text
+
+
+def translate_entry(entry, translate_to: Optional[str]) -> Optional[str]:
+    if not translate_to:
+        return None
+    title = getattr(entry, "title", "(no title)")
+    summary = clean_summary(entry)
+    tr = translate_text(_ensure_len(f"{title}\n{summary}" if summary else title, 800), translate_to)
+    return _ensure_len(tr, 900) if tr else None
+
+
+def build_message(source: str, entry, translate_to: Optional[str], translation: Optional[str] = None) -> str:
     title = getattr(entry, "title", "(no title)")
     link = getattr(entry, "link", "")
     published = getattr(entry, "published", "") or getattr(entry, "updated", "")
     msg = f"[{source}] {title}\n{link}"
     if published:
         msg += f"\nPublished: {published}"
-    # Optional translation
-    if translate_to:
-        summary = getattr(entry, "summary", None) or getattr(entry, "description", None) or ""
-        compact = _ensure_len(f"{title}\n{summary}", 800)
-        tr = translate_text(compact, translate_to)
-        if tr:
-            msg += f"\n\n[번역]\n{_ensure_len(tr, 900)}"
+    # Optional translation (precomputed `translation` wins)
+    if translation is None:
+        translation = translate_entry(entry, translate_to)
+    if translation:
+        msg += f"\n\n[번역]\n{translation}"
     return _ensure_len(msg, 1900)
 
 
-def entry_age_hours(entry) -> Optional[float]:
+def entry_epoch(entry) -> Optional[float]:
+    # *_parsed are UTC struct_time: timegm, not mktime (which assumes local time)
+    try:
+        return entry._utc_epoch
+    except AttributeError:
+        pass
     ts = getattr(entry, "published_parsed", None) or getattr(entry, "updated_parsed", None)
-    if not ts:
-        return None
+    epoch: Optional[float] = None
+    if ts:
+        try:
+            epoch = float(calendar.timegm(ts))
+        except Exception:
+            epoch = None
     try:
-        epoch = time.mktime(ts)
-        return (time.time() - epoch) / 3600.0
+        entry._utc_epoch = epoch
     except Exception:
+        pass
+    return epoch
+
+
+def entry_age_hours(entry, now: Optional[float] = None) -> Optional[float]:
+    epoch = entry_epoch(entry)
+    if epoch is None:
         return None
+    return ((time.time() if now is None else now) - epoch) / 3600.0
+
+
+# Selection: recency decay + source weight + keyword relevance, top-k via heaps
+DEFAULT_KEYWORDS = "growth:1,retention:0.8,acquisition:0.8,activation:0.6,onboarding:0.6,plg:0.6,experiment:0.5,pricing:0.5,referral:0.5,seo:0.4"
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#-]*")
+
+
+def build_keyword_index(spec: str) -> Dict[str, float]:
+    index: Dict[str, float] = {}
+    for part in spec.split(","):
+        term, _, weight = part.partition(":")
+        term = term.strip().lower()
+        if not term:
+            continue
+        try:
+            index[term] = float(weight) if weight.strip() else 1.0
+        except ValueError:
+            index[term] = 1.0
+    return index
+
+
+def keyword_relevance(text: str, index: Dict[str, float]) -> float:
+    if not index or not text:
+        return 0.0
+    raw = sum(index.get(t, 0.0) for t in set(_TOKEN_RE.findall(text.lower())))
+    return 1.0 - math.exp(-raw) if raw > 0 else 0.0
+
+
+def make_scorer(keyword_index: Dict[str, float], source_weights: Dict[str, float]) -> Callable[[Tuple[Optional[float], str, Any]], float]:
+    w_recency = float(os.environ.get("SCORE_W_RECENCY", "1.0"))
+    w_source = float(os.environ.get("SCORE_W_SOURCE", "0.5"))
+    w_keyword = float(os.environ.get("SCORE_W_KEYWORD", "1.0"))
+    half_life = max(float(os.environ.get("RECENCY_HALF_LIFE_HOURS", "24")), 0.1)
+    jitter = float(os.environ.get("SCORE_JITTER", "0"))
+    undated_recency = float(os.environ.get("UNDATED_RECENCY", "0"))
+    now = time.time()
+
+    def score(candidate: Tuple[Optional[float], str, Any]) -> float:
+        epoch, source, entry = candidate
+        if epoch is None:
+            recency = undated_recency  # undated: no free freshness
+        else:
+            recency = 0.5 ** (max((now - epoch) / 3600.0, 0.0) / half_life)
+        relevance = keyword_relevance(f"{getattr(entry, 'title', '') or ''} {clean_summary(entry)}", keyword_index)
+        value = w_recency * recency + w_source * source_weights.get(source, 1.0) + w_keyword * relevance
+        return value + random.uniform(0.0, jitter) if jitter else value
+
+    return score
+
+
+class CandidateReservoir:
+    def __init__(self, k: int, max_per_source: int, score: Callable[[Tuple[Optional[float], str, Any]], float]) -> None:
+        self.k = k
+        self.max_per_source = max_per_source
+        self.score = score
+        self.offered = 0
+        self._size = 0
+        self._seq = 0
+        self._links: Set[str] = set()
+        self._by_source: Dict[str, List[Tuple[float, int, Tuple[Optional[float], str, Any]]]] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _forget(self, item: Tuple[float, int, Tuple[Optional[float], str, Any]]) -> None:
+        self._links.discard(getattr(item[2][2], "link", ""))
+
+    def offer(self, epoch: Optional[float], source: str, entry: Any) -> None:
+        self.offered += 1
+        link = getattr(entry, "link", "")
+        if self.k <= 0 or self.max_per_source <= 0 or link in self._links:
+            return
+        cand = (epoch, source, entry)
+        item = (self.score(cand), self._seq, cand)
+        self._seq += 1
+        heap = self._by_source.setdefault(source, [])
+        if len(heap) >= self.max_per_source:
+            # Source is full: swap out its weakest pick if this one beats it
+            if item[:2] > heap[0][:2]:
+                self._forget(heapq.heapreplace(heap, item))
+                self._links.add(link)
+            return
+        heapq.heappush(heap, item)
+        self._links.add(link)
+        self._size += 1
+        if self._size > self.k:
+            weakest = min(self._by_source, key=lambda s: self._by_source[s][0][:2])
+            self._forget(heapq.heappop(self._by_source[weakest]))
+            if not self._by_source[weakest]:
+                del self._by_source[weakest]
+            self._size -= 1
+
+    def result(self) -> List[Tuple[Optional[float], str, Any]]:
+        items = [item for heap in self._by_source.values() for item in heap]
+        return [cand for _, _, cand in sorted(items, reverse=True, key=lambda item: item[:2])]
 
 
 def load_cache(path: str) -> Set[str]:
@@ -239,6 +1131,8 @@ def save_cache(path: str, links: Set[str]) -> None:
 
 # Translation (reuse from agile bot by minimal inline impl)
 def _translate_deepl(text: str, target: str) -> Optional[str]:
+    import urllib.request
+
     api_key = os.environ.get("DEEPL_API_KEY")
     if not api_key:
         return None
@@ -266,6 +1160,8 @@ def _translate_deepl(text: str, target: str) -> Optional[str]:
 
 
 def _translate_libre(text: str, target: str) -> Optional[str]:
+    import urllib.request
+
     base = os.environ.get("LIBRETRANSLATE_URL")
     if not base:
         return None
@@ -289,6 +1185,8 @@ def _translate_libre(text: str, target: str) -> Optional[str]:
 
 
 def _translate_openai(text: str, target: str) -> Optional[str]:
+    import urllib.request
+
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         return None
@@ -319,34 +1217,122 @@ def _translate_openai(text: str, target: str) -> Optional[str]:
     return None
 
 
+class _TokenBucket:
+    def __init__(self, rate: float, burst: float = 1.0) -> None:
+        self.rate = rate
+        self.capacity = max(burst, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# name → (function, env var that enables it, default concurrency, default requests/second)
+_BACKENDS: Dict[str, Tuple[Callable[[str, str], Optional[str]], str, int, float]] = {
+    "deepl": (_translate_deepl, "DEEPL_API_KEY", 2, 2.0),
+    "libre": (_translate_libre, "LIBRETRANSLATE_URL", 4, 4.0),
+    "openai": (_translate_openai, "OPENAI_API_KEY", 4, 2.0),
+}
+_backend_limits: Dict[str, Tuple[threading.Semaphore, _TokenBucket]] = {}
+_backend_limits_lock = threading.Lock()
+
+
+def _limits_for(name: str) -> Tuple[threading.Semaphore, _TokenBucket]:
+    with _backend_limits_lock:
+        limits = _backend_limits.get(name)
+        if limits is None:
+            _, _, concurrency, rps = _BACKENDS[name]
+            key = name.upper()
+            concurrency = int(os.environ.get(f"TRANSLATE_CONCURRENCY_{key}", concurrency))
+            rps = float(os.environ.get(f"TRANSLATE_RPS_{key}", rps))
+            limits = (threading.BoundedSemaphore(max(concurrency, 1)), _TokenBucket(rps, burst=max(concurrency, 1)))
+            _backend_limits[name] = limits
+        return limits
+
+
+def _call_backend(name: str, text: str, target: str) -> Optional[str]:
+    fn, env_key, _, _ = _BACKENDS[name]
+    if not os.environ.get(env_key):
+        return None
+    sem, bucket = _limits_for(name)
+    with sem:
+        bucket.acquire()
+        return fn(text, target)
+
+
 def translate_text(text: str, target: Optional[str]) -> Optional[str]:
     if not target:
         return None
     target = target.lower()
+    # Preferred backend (TRANSLATE_BACKEND) first, then the rest as fallback
+    order = ["deepl", "libre", "openai"]
     backend = os.environ.get("TRANSLATE_BACKEND", "").lower()
-    if backend == "deepl":
-        tr = _translate_deepl(text, target)
-        if tr:
-            return tr
-    elif backend == "libre":
-        tr = _translate_libre(text, target)
-        if tr:
-            return tr
-    elif backend == "openai":
-        tr = _translate_openai(text, target)
-        if tr:
-            return tr
-    for fn in (_translate_deepl, _translate_libre, _translate_openai):
-        tr = fn(text, target)
+    if backend in order:
+        order.remove(backend)
+        order.insert(0, backend)
+    for name in order:
+        tr = _call_backend(name, text, target)
         if tr:
             return tr
     return None
 
 
-def main() -> None:
-    webhook = get_env("DISCORD_WEBHOOK_URL")
+def translate_entries(entries: List[Any], translate_to: Optional[str]) -> List[Optional[str]]:
+    if not translate_to or not entries:
+        return [None] * len(entries)
+    import concurrent.futures
+
+    workers = max(int(os.environ.get("TRANSLATE_WORKERS", "8")), 1)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(workers, len(entries))) as pool:
+        return list(pool.map(lambda entry: translate_entry(entry, translate_to), entries))
+
+
+def report_startup(label: str) -> None:
+    elapsed_ms = (time.perf_counter() - _STARTED_AT) * 1000.0
+    budget_ms = float(os.environ.get("STARTUP_BUDGET_MS", "250"))
+    if elapsed_ms > budget_ms:
+        print(f"[WARN] Startup ({label}) took {elapsed_ms:.0f} ms, over the {budget_ms:.0f} ms budget", file=sys.stderr)
+    else:
+        print(f"[INFO] Startup ({label}) ready in {elapsed_ms:.0f} ms")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Post growth news to Discord.")
+    parser.add_argument("--flush-outbox", action="store_true", help="only retry queued posts; skip fetching and translation")
+    parser.add_argument("--search", metavar="QUERY", help="search posted history (title, summary, source, translation) and exit")
+    parser.add_argument("--limit", type=int, default=20, help="max results for --search (default 20)")
+    args = parser.parse_args(argv)
+
+    history = HistoryIndex(os.environ.get("HISTORY_DB", ".cache/growth_news_history.sqlite"))
+    if args.search is not None:
+        print_search_results(history.search(args.search, args.limit))
+        return
+
+    destinations = load_destinations("config/growth_news_destinations.yml")
+    outbox = Outbox.from_env(".cache/growth_news_outbox.json", on_sent=history.add_item)
+    report_startup("flush-outbox" if args.flush_outbox else "run")
+    if outbox.items:
+        resent = sum(outbox.flush(destinations).values())
+        print(f"[INFO] Outbox: resent {resent}, {len(outbox.items)} still pending")
+    if args.flush_outbox:
+        return
+
     sources = default_sources()
-    user_sources = load_sources_from_yaml("config/growth_news_sources.yml")
+    config_path = "config/growth_news_sources.yml"
+    user_sources = load_sources_from_yaml(config_path)
     if user_sources:
         sources = user_sources
 
@@ -356,81 +1342,82 @@ def main() -> None:
     cache_links = set() if disable_cache else load_cache(cache_path)
     translate_to = os.environ.get("TRANSLATE_TO", "").strip() or None
 
-    # Collect candidates
+    daily_count = int(os.environ.get("DAILY_COUNT", "3"))
+    max_per_source = int(os.environ.get("MAX_PER_SOURCE", "1"))
+    keyword_index = build_keyword_index(os.environ.get("SCORE_KEYWORDS", DEFAULT_KEYWORDS))
+    reservoir = CandidateReservoir(daily_count, max_per_source, make_scorer(keyword_index, load_source_weights(config_path)))
+
+    # Stream candidates into the bounded reservoir as feeds arrive
     per_feed_limit = int(os.environ.get("PER_FEED_LIMIT", "5"))
-    candidates: List[Tuple[float, str, Any]] = []
-    seen: Set[str] = set()
-    for source, url in sources:
+    now = time.time()
+    for source, feed in fetch_all(sources):
         try:
-            feed = fetch_feed(url)
             if getattr(feed, 'bozo', False):
                 continue
             for entry in (getattr(feed, 'entries', []) or [])[:per_feed_limit]:
                 link = getattr(entry, "link", "")
-                if not link or link in seen or link in cache_links:
+                if not link or link in cache_links:
                     continue
-                age = entry_age_hours(entry)
+                age = entry_age_hours(entry, now)
                 if age is not None and age > window_hours:
                     continue
-                ts = getattr(entry, "published_parsed", None) or getattr(entry, "updated_parsed", None)
-                epoch = time.mktime(ts) if ts else time.time()
-                candidates.append((epoch, source, entry))
-                seen.add(link)
+                reservoir.offer(entry_epoch(entry), source, entry)
         except Exception as e:
             print(f"[WARN] Fetch {source}: {e}", file=sys.stderr)
             continue
 
-    if not candidates:
+    if not reservoir.offered:
         # Relax the time window: include entries ignoring age constraint
         try:
-            for source, url in sources:
+            for source, feed in fetch_all(sources):
                 try:
-                    feed = fetch_feed(url)
                     for entry in (getattr(feed, 'entries', []) or [])[:per_feed_limit]:
                         link = getattr(entry, "link", "")
                         if not link:
                             continue
                         if link in cache_links:
                             continue
-                        ts = getattr(entry, "published_parsed", None) or getattr(entry, "updated_parsed", None)
-                        epoch = time.mktime(ts) if ts else time.time()
-                        candidates.append((epoch, source, entry))
+                        reservoir.offer(entry_epoch(entry), source, entry)
                 except Exception:
                     continue
         except Exception:
             pass
-        if not candidates:
+        if not reservoir.offered:
             if not disable_cache:
                 save_cache(cache_path, cache_links)
             return
+    selected = reservoir.result()
 
-    daily_count = int(os.environ.get("DAILY_COUNT", "3"))
-    max_per_source = int(os.environ.get("MAX_PER_SOURCE", "1"))
-    random.shuffle(candidates)
-    selected: List[Tuple[float, str, Any]] = []
-    used: Dict[str, int] = {}
-    for epoch, source, entry in candidates:
-        if len(selected) >= daily_count:
-            break
-        if used.get(source, 0) >= max_per_source:
-            continue
-        selected.append((epoch, source, entry))
-        used[source] = used.get(source, 0) + 1
-
-    for _, source, entry in sorted(selected, key=lambda x: -x[0]):
+    delivered: Dict[str, int] = {dest.name: 0 for dest in destinations}
+    attempted = 0
+    ordered = [(source, entry) for _, source, entry in sorted(selected, key=lambda x: -(x[0] or 0.0))]
+    # Translate all selected items concurrently, then post in order
+    translations = translate_entries([entry for _, entry in ordered], translate_to)
+    for (source, entry), translation in zip(ordered, translations):
         link = getattr(entry, "link", "")
         if not link:
             continue
+        msg = build_message(source, entry, None, translation)
+        attempted += 1
+        meta = {
+            "title": getattr(entry, "title", "") or "",
+            "summary": clean_summary(entry),
+            "source": source,
+            "published": entry_epoch(entry),
+            "translation": translation,
+        }
+        # Queued before sending, so marking the link handled can't lose the item
+        queued = outbox.enqueue(msg, link, destinations, meta)
         cache_links.add(link)
-        msg = build_message(source, entry, translate_to)
-        try:
-            post_discord(webhook, msg)
-        except Exception as e:
-            print(f"[WARN] Discord post failed: {e}", file=sys.stderr)
-        time.sleep(1.2)
+        for name, count in outbox.flush(destinations, queued).items():
+            delivered[name] += count
 
     if not disable_cache:
         save_cache(cache_path, cache_links)
+    for name, count in delivered.items():
+        print(f"[INFO] Destination {name}: {count}/{attempted} delivered")
+    if outbox.items:
+        print(f"[INFO] Outbox: {len(outbox.items)} post(s) pending for the next run")
 
 
 if __name__ == "__main__":